@@ -3,11 +3,12 @@ Main application entry point following SOLID principles.
 
 Assembles all modules and initializes the Flask application.
 """
-from flask import Flask, jsonify
+from flask import Flask, Response, jsonify
 from flask_cors import CORS
 from shared.config import Config
 from shared.database import db
 from shared.exceptions import AppException
+from shared.json_provider import OrjsonProvider
 
 # Import repositories
 from features.auth.repository import UserRepository
@@ -38,6 +39,7 @@ def create_app():
     Creates and configures the Flask application with all dependencies.
     """
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     
     # Configuration
     app.config['SECRET_KEY'] = Config.SECRET_KEY
@@ -113,27 +115,36 @@ def create_app():
             'database': 'connected' if db_healthy else 'disconnected'
         }), 200 if db_healthy else 503
     
-    # API info endpoint
+    # API info endpoint - static payload serialized once
+    api_info_body = app.json.dumps({
+        'name': 'Mood Tracker API',
+        'version': '2.0.0',
+        'endpoints': {
+            'auth': '/api/auth',
+            'moods': '/api/moods',
+            'tags': '/api/tags',
+            'analytics': '/api/analytics',
+            'insights': '/api/insights',
+            'export': '/api/export'
+        }
+    })
+
     @app.route('/api')
     def api_info():
         """API information endpoint."""
-        return jsonify({
-            'name': 'Mood Tracker API',
-            'version': '2.0.0',
-            'endpoints': {
-                'auth': '/api/auth',
-                'moods': '/api/moods',
-                'tags': '/api/tags',
-                'analytics': '/api/analytics',
-                'insights': '/api/insights',
-                'export': '/api/export'
-            }
-        })
+        return Response(api_info_body, mimetype='application/json')
     
     # Global error handlers
     @app.errorhandler(AppException)
     def handle_app_exception(error):
         """Handle custom application exceptions."""
+        if error.status_code >= 500:
+            # Server-side errors (e.g. DatabaseError) may carry driver text
+            app.logger.error("Unhandled %s: %s", type(error).__name__, error.message)
+            return jsonify({
+                'success': False,
+                'error': 'Internal server error'
+            }), error.status_code
         return jsonify({
             'success': False,
             'error': error.message
@@ -150,9 +161,7 @@ def create_app():
     @app.errorhandler(500)
     def internal_error(error):
         """Handle 500 errors."""
-        print(f"Internal server error: {error}")
-        import traceback
-        traceback.print_exc()
+        # Flask's handle_exception has already logged the traceback
         return jsonify({
             'success': False,
             'error': 'Internal server error'
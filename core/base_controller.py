@@ -6,8 +6,10 @@ Handles HTTP concerns and delegates to service layer.
 """
 from abc import ABC
 from typing import Generic, TypeVar
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, current_app, jsonify, request
 from functools import wraps
+from core.interfaces import APIResponse
+from shared.exceptions import AppException
 
 T = TypeVar('T')  # Entity type
 ID = TypeVar('ID', int, str)  # ID type
@@ -52,19 +54,33 @@ class BaseController(ABC, Generic[T, ID]):
             try:
                 result = handler_func(*args, **kwargs)
 
+                # If result is tuple (response, status), return as is.
+                # Checked first: success_response returns one for nearly every route
+                if isinstance(result, tuple):
+                    return result
+
                 # If result is APIResponse, convert to JSON
-                if hasattr(result, 'to_dict'):
+                if isinstance(result, APIResponse):
                     response_dict = result.to_dict()
                     status_code = 200 if result.success else 400
                     return jsonify(response_dict), status_code
 
-                # If result is tuple (response, status), return as is
-                if isinstance(result, tuple):
-                    return result
-
                 # Otherwise, wrap in success response
                 return jsonify({'success': True, 'data': result}), 200
 
+            except AppException as e:
+                # Client errors carry their own status; the app-level handler
+                # renders them without logging a traceback. Server-side ones
+                # (e.g. DatabaseError) fall through to the generic 500 below
+                # so driver messages never reach the client.
+                if e.status_code < 500:
+                    raise
+                current_app.logger.exception("Unexpected error in %s", handler_func.__name__)
+                return jsonify({
+                    'success': False,
+                    'error': 'Internal server error'
+                }), 500
+
             except ValueError as e:
                 # Validation errors
                 return jsonify({
@@ -80,10 +96,8 @@ class BaseController(ABC, Generic[T, ID]):
                 }), 403
 
             except Exception as e:
-                # Unexpected errors
-                print(f"Unexpected error in {handler_func.__name__}: {e}")
-                import traceback
-                traceback.print_exc()
+                # Unexpected errors - logged with traceback, never returned to client
+                current_app.logger.exception("Unexpected error in %s", handler_func.__name__)
                 return jsonify({
                     'success': False,
                     'error': 'Internal server error'
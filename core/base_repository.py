@@ -40,6 +40,17 @@ class BaseRepository(ABC, Generic[T, ID]):
         with self.db.get_connection() as conn:
             yield conn
 
+    @contextmanager
+    def transaction(self):
+        """
+        Share one connection across several repository calls.
+
+        Repository methods called inside the block (on any repository
+        sharing this database) reuse the connection and commit together.
+        """
+        with self.db.transaction() as conn:
+            yield conn
+
     @abstractmethod
     def _to_entity(self, row: Dict[str, Any]) -> T:
         """
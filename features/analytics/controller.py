@@ -61,3 +61,11 @@ class AnalyticsController:
             """Compare current week vs previous week."""
             data = self.service.get_week_comparison(current_user.id)
             return {'success': True, 'data': data}, 200
+
+        @self.blueprint.route('/dashboard', methods=['GET'])
+        @login_required_api
+        def get_dashboard():
+            """Get quick stats, week comparison, distribution and trends together."""
+            days = request.args.get('days', 30, type=int)
+            data = self.service.get_dashboard(current_user.id, days)
+            return {'success': True, 'data': data}, 200
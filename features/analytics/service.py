@@ -1,78 +1,77 @@
 """
 Analytics service following Service Layer Pattern and SOLID principles.
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Callable, Optional
 from datetime import date, timedelta, datetime
-from collections import defaultdict
-from shared.models import MoodType
+from shared.cache import TTLCache
+from shared.config import Config
 
 
 class AnalyticsService:
     """Analytics service for mood data analysis."""
 
-    def __init__(self, mood_repository):
+    def __init__(self, mood_repository, cache: Optional[TTLCache] = None):
         self.mood_repository = mood_repository
+        self.cache = cache or TTLCache(Config.ANALYTICS_CACHE_SIZE, Config.ANALYTICS_CACHE_TTL)
+
+    def _cached(self, name: str, user_id: int, args: tuple, compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Serve a result from the cache when nothing it depends on has changed.
+
+        The key includes today's date, so results roll over at midnight, and
+        the user's data version, so a mood write from any process makes old
+        entries unreachable.
+        """
+        key = (name, user_id, args, date.today().toordinal(), self.mood_repository.data_version(user_id))
+        return self.cache.get_or_compute(key, compute)
 
     def get_mood_distribution(self, user_id: int, days: int = 30) -> Dict[str, Any]:
         """Get mood distribution for last N days."""
+        return self._cached('get_mood_distribution', user_id, (days,), lambda: self._get_mood_distribution(user_id, days))
+
+    def _get_mood_distribution(self, user_id: int, days: int) -> Dict[str, Any]:
         end_date = date.today()
         start_date = end_date - timedelta(days=days)
         
-        moods = self.mood_repository.find_by_user_and_date_range(user_id, start_date, end_date)
-        
-        distribution = defaultdict(int)
-        for mood in moods:
-            distribution[mood.mood] += 1
+        distribution = self.mood_repository.count_by_mood(user_id, start_date, end_date)
         
         return {
-            'distribution': dict(distribution),
-            'total': len(moods),
+            'distribution': distribution,
+            'total': sum(distribution.values()),
             'period_days': days
         }
 
     def get_average_mood(self, user_id: int, days: int = 30) -> Dict[str, Any]:
         """Calculate average mood for last N days."""
-        end_date = date.today()
-        start_date = end_date - timedelta(days=days)
-        
-        moods = self.mood_repository.find_by_user_and_date_range(user_id, start_date, end_date)
+        return self._cached('get_average_mood', user_id, (days,), lambda: self._get_average_mood(user_id, days))
+
+    def _get_average_mood(self, user_id: int, days: int) -> Dict[str, Any]:
+        window = self.mood_repository.average_mood_windows(user_id, [days], date.today())[days]
         
-        if not moods:
+        if not window['count']:
             return {'average': None, 'count': 0}
         
-        total_value = sum(MoodType.get_value(m.mood) for m in moods)
-        average = total_value / len(moods)
-        
         return {
-            'average': round(average, 2),
-            'count': len(moods),
+            'average': round(window['average'], 2),
+            'count': window['count'],
             'period_days': days
         }
 
     def get_trends(self, user_id: int, days: int = 30) -> Dict[str, Any]:
         """Analyze mood trends over time."""
+        return self._cached('get_trends', user_id, (days,), lambda: self._get_trends(user_id, days))
+
+    def _get_trends(self, user_id: int, days: int) -> Dict[str, Any]:
         end_date = date.today()
         start_date = end_date - timedelta(days=days)
         
-        moods = self.mood_repository.find_by_user_and_date_range(user_id, start_date, end_date)
+        # Linear regression runs in SQL; only the count and slope come back
+        count, slope = self.mood_repository.mood_trend(user_id, start_date, end_date)
         
-        if len(moods) < 2:
+        if count < 2:
             return {'trend': 'insufficient_data', 'slope': 0}
         
-        # Calculate linear regression
-        mood_values = [(i, MoodType.get_value(m.mood)) for i, m in enumerate(moods)]
-        
-        n = len(mood_values)
-        x_values = [i for i, _ in mood_values]
-        y_values = [v for _, v in mood_values]
-        
-        x_mean = sum(x_values) / n
-        y_mean = sum(y_values) / n
-        
-        numerator = sum((x - x_mean) * (y - y_mean) for x, y in mood_values)
-        denominator = sum((x - x_mean) ** 2 for x in x_values)
-        
-        slope = numerator / denominator if denominator != 0 else 0
+        slope = slope or 0
         
         trend = 'improving' if slope > 0.05 else 'declining' if slope < -0.05 else 'stable'
         
@@ -84,19 +83,16 @@ class AnalyticsService:
 
     def get_hourly_patterns(self, user_id: int, days: int = 30) -> Dict[str, Any]:
         """Analyze mood patterns by hour of day."""
+        return self._cached('get_hourly_patterns', user_id, (days,), lambda: self._get_hourly_patterns(user_id, days))
+
+    def _get_hourly_patterns(self, user_id: int, days: int) -> Dict[str, Any]:
         end_date = date.today()
         start_date = end_date - timedelta(days=days)
         
-        moods = self.mood_repository.find_by_user_and_date_range(user_id, start_date, end_date)
-        
-        hourly_data = defaultdict(list)
-        for mood in moods:
-            hour = mood.hour
-            hourly_data[hour].append(MoodType.get_value(mood.mood))
-        
-        hourly_averages = {}
-        for hour, values in hourly_data.items():
-            hourly_averages[hour] = round(sum(values) / len(values), 2)
+        hourly_averages = {
+            hour: round(avg, 2)
+            for hour, avg in self.mood_repository.hourly_averages(user_id, start_date, end_date).items()
+        }
         
         return {
             'hourly_averages': hourly_averages,
@@ -105,20 +101,32 @@ class AnalyticsService:
 
     def get_quick_stats(self, user_id: int) -> Dict[str, Any]:
         """Get quick statistics overview."""
-        today_moods = self.mood_repository.find_by_user_and_date(user_id, date.today())
-        week_avg = self.get_average_mood(user_id, days=7)
-        month_avg = self.get_average_mood(user_id, days=30)
+        return self._cached('get_quick_stats', user_id, (), lambda: self._get_quick_stats(user_id))
+
+    def _get_quick_stats(self, user_id: int) -> Dict[str, Any]:
+        today = date.today()
+        # Today's count and both trailing averages in one aggregate query
+        today_window, week, month = self.mood_repository.average_mood_ranges(user_id, [
+            (today, today),
+            (today - timedelta(days=7), today),
+            (today - timedelta(days=30), today)
+        ])
+        week_avg = week['average']
+        month_avg = month['average']
         total_count = self.mood_repository.count_by_user(user_id)
         
         return {
-            'today_count': len(today_moods),
-            'week_average': week_avg.get('average'),
-            'month_average': month_avg.get('average'),
+            'today_count': today_window['count'],
+            'week_average': round(week_avg, 2) if week_avg is not None else None,
+            'month_average': round(month_avg, 2) if month_avg is not None else None,
             'total_entries': total_count
         }
 
     def get_week_comparison(self, user_id: int) -> Dict[str, Any]:
         """Compare current week vs previous week."""
+        return self._cached('get_week_comparison', user_id, (), lambda: self._get_week_comparison(user_id))
+
+    def _get_week_comparison(self, user_id: int) -> Dict[str, Any]:
         today = date.today()
         
         # Current week
@@ -129,24 +137,32 @@ class AnalyticsService:
         prev_week_start = current_week_start - timedelta(days=7)
         prev_week_end = current_week_start - timedelta(days=1)
         
-        current_moods = self.mood_repository.find_by_user_and_date_range(
-            user_id, current_week_start, current_week_end
-        )
-        prev_moods = self.mood_repository.find_by_user_and_date_range(
-            user_id, prev_week_start, prev_week_end
-        )
+        current, prev = self.mood_repository.average_mood_ranges(user_id, [
+            (current_week_start, current_week_end),
+            (prev_week_start, prev_week_end)
+        ])
         
-        current_avg = sum(MoodType.get_value(m.mood) for m in current_moods) / len(current_moods) if current_moods else 0
-        prev_avg = sum(MoodType.get_value(m.mood) for m in prev_moods) / len(prev_moods) if prev_moods else 0
+        current_avg = current['average'] or 0
+        prev_avg = prev['average'] or 0
         
         return {
             'current_week': {
                 'average': round(current_avg, 2),
-                'count': len(current_moods)
+                'count': current['count']
             },
             'previous_week': {
                 'average': round(prev_avg, 2),
-                'count': len(prev_moods)
+                'count': prev['count']
             },
-            'change': round(current_avg - prev_avg, 2) if current_moods and prev_moods else 0
+            'change': round(current_avg - prev_avg, 2) if current['count'] and prev['count'] else 0
         }
+
+    def get_dashboard(self, user_id: int, days: int = 30) -> Dict[str, Any]:
+        """Everything the dashboard shows, from one request on one connection."""
+        with self.mood_repository.transaction():
+            return {
+                'quick_stats': self.get_quick_stats(user_id),
+                'week_comparison': self.get_week_comparison(user_id),
+                'distribution': self.get_mood_distribution(user_id, days),
+                'trends': self.get_trends(user_id, days)
+            }
@@ -14,6 +14,7 @@ class FlaskUser(UserMixin):
     """Flask-Login user wrapper - Adapter Pattern."""
 
     def __init__(self, user):
+        self.user = user
         self.id = user.id
         self.email = user.email
         self.name = user.name
@@ -116,11 +117,8 @@ class AuthController(BaseController):
             if not current_user.is_authenticated:
                 return self.error_response('Not authenticated', 401)
 
-            user = self.user_repository.find_by_id(current_user.id)
-            if not user:
-                return self.error_response('User not found', 404)
-
-            return self.success_response(user.to_dict())
+            # Reuse the entity user_loader already fetched for this request
+            return self.success_response(current_user.user.to_dict())
 
         @self.blueprint.route('/status', methods=['GET'])
         @self.handle_request
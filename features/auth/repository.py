@@ -16,6 +16,11 @@ class UserRepository(BaseRepository[User, int]):
     Manages user data persistence with PostgreSQL.
     """
 
+    def __init__(self, db):
+        super().__init__(db)
+        # Whether users has the optional last_login column; probed on first use
+        self._has_last_login: Optional[bool] = None
+
     def _get_table_name(self) -> str:
         """Get table name for users."""
         return "users"
@@ -89,15 +94,33 @@ class UserRepository(BaseRepository[User, int]):
         Args:
             user_id: User identifier
         """
+        if not self._last_login_column_exists():
+            return
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                # Try to update if column exists
                 cursor.execute('''
                     UPDATE users
                     SET last_login = CURRENT_TIMESTAMP
                     WHERE id = %s
                 ''', (user_id,))
         except Exception:
-            # Column might not exist, ignore
+            # Column might have been dropped since the probe, ignore
             pass
+
+    def _last_login_column_exists(self) -> bool:
+        """Check the catalog once for users.last_login instead of failing an UPDATE per login."""
+        if self._has_last_login is None:
+            try:
+                with self.get_connection() as conn:
+                    cursor = conn.cursor()
+                    cursor.execute('''
+                        SELECT EXISTS (
+                            SELECT 1 FROM pg_attribute
+                            WHERE attrelid = 'users'::regclass AND attname = 'last_login' AND NOT attisdropped
+                        ) AS present
+                    ''')
+                    self._has_last_login = cursor.fetchone()['present']
+            except Exception:
+                return False
+        return self._has_last_login
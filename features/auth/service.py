@@ -5,12 +5,15 @@ Handles OAuth authentication logic and user session management.
 """
 import requests
 import urllib.parse
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any, Optional
 from core.base_service import BaseService
 from shared.models import User
 from shared.config import Config
 from shared.exceptions import AuthenticationError, ValidationError
 
+_OAUTH_PROVIDERS = frozenset({'google', 'github'})
+
 
 class AuthService(BaseService[User, int]):
     """
@@ -22,6 +25,20 @@ class AuthService(BaseService[User, int]):
     def __init__(self, repository):
         """Initialize with user repository."""
         super().__init__(repository)
+        # Shared adapter keeps provider connections alive between calls. Its
+        # urllib3 pool is thread-safe; a Session (and its cookie jar) is not,
+        # so each exchange gets its own session mounted on this adapter.
+        self._http_adapter = HTTPAdapter()
+
+    def _http_session(self) -> requests.Session:
+        """
+        Create a per-exchange session that reuses the shared connection pool.
+
+        Never close it: Session.close() would also close the shared adapter.
+        """
+        session = requests.Session()
+        session.mount('https://', self._http_adapter)
+        return session
 
     def _validate_create(self, data: Dict[str, Any]) -> None:
         """Validate user creation data."""
@@ -30,7 +47,7 @@ class AuthService(BaseService[User, int]):
         if missing:
             raise ValidationError(f"Missing required fields: {', '.join(missing)}")
 
-        if data['provider'] not in ['google', 'github']:
+        if data['provider'] not in _OAUTH_PROVIDERS:
             raise ValidationError(f"Invalid provider: {data['provider']}")
 
     def _validate_update(self, id: int, data: Dict[str, Any]) -> None:
@@ -52,7 +69,7 @@ class AuthService(BaseService[User, int]):
         Raises:
             ValidationError: If provider is invalid or not configured
         """
-        if provider not in ['google', 'github']:
+        if provider not in _OAUTH_PROVIDERS:
             raise ValidationError(f"Invalid OAuth provider: {provider}")
 
         client_id = getattr(Config, f'{provider.upper()}_CLIENT_ID')
@@ -127,18 +144,18 @@ class AuthService(BaseService[User, int]):
         """
         try:
             if provider == 'google':
-                return self._exchange_google_code(code, redirect_uri)
+                return self._exchange_google_code(self._http_session(), code, redirect_uri)
             elif provider == 'github':
-                return self._exchange_github_code(code, redirect_uri)
+                return self._exchange_github_code(self._http_session(), code, redirect_uri)
             else:
                 raise AuthenticationError(f"Unsupported provider: {provider}")
         except requests.RequestException as e:
             raise AuthenticationError(f"OAuth provider communication failed: {str(e)}")
 
-    def _exchange_google_code(self, code: str, redirect_uri: str) -> Dict[str, Any]:
+    def _exchange_google_code(self, http: requests.Session, code: str, redirect_uri: str) -> Dict[str, Any]:
         """Exchange Google OAuth code for user info."""
         # Get access token
-        token_response = requests.post('https://oauth2.googleapis.com/token', data={
+        token_response = http.post('https://oauth2.googleapis.com/token', data={
             'client_id': Config.GOOGLE_CLIENT_ID,
             'client_secret': Config.GOOGLE_CLIENT_SECRET,
             'code': code,
@@ -153,7 +170,7 @@ class AuthService(BaseService[User, int]):
         access_token = token_data.get('access_token')
 
         # Get user info
-        user_response = requests.get(
+        user_response = http.get(
             'https://www.googleapis.com/oauth2/v2/userinfo',
             headers={'Authorization': f'Bearer {access_token}'}
         )
@@ -167,10 +184,10 @@ class AuthService(BaseService[User, int]):
             'name': user_data.get('name', user_data.get('email'))
         }
 
-    def _exchange_github_code(self, code: str, redirect_uri: str) -> Dict[str, Any]:
+    def _exchange_github_code(self, http: requests.Session, code: str, redirect_uri: str) -> Dict[str, Any]:
         """Exchange GitHub OAuth code for user info."""
         # Get access token
-        token_response = requests.post(
+        token_response = http.post(
             'https://github.com/login/oauth/access_token',
             data={
                 'client_id': Config.GITHUB_CLIENT_ID,
@@ -188,7 +205,7 @@ class AuthService(BaseService[User, int]):
         access_token = token_data.get('access_token')
 
         # Get user info
-        user_response = requests.get(
+        user_response = http.get(
             'https://api.github.com/user',
             headers={
                 'Authorization': f'Bearer {access_token}',
@@ -204,7 +221,7 @@ class AuthService(BaseService[User, int]):
         # GitHub email might be private, need to fetch separately
         email = user_data.get('email')
         if not email:
-            email_response = requests.get(
+            email_response = http.get(
                 'https://api.github.com/user/emails',
                 headers={
                     'Authorization': f'Bearer {access_token}',
@@ -35,10 +35,11 @@ class ExportController:
         def export_csv():
             """Export mood data as CSV."""
             days = request.args.get('days', 30, type=int)
-            csv_data = self.service.export_to_csv(current_user.id, days)
+            # A generator body is streamed to the client chunk by chunk
+            csv_chunks = self.service.export_to_csv(current_user.id, days)
             
             return Response(
-                csv_data,
+                csv_chunks,
                 mimetype='text/csv',
                 headers={'Content-Disposition': 'attachment;filename=mood_data.csv'}
             )
@@ -1,10 +1,15 @@
 """
 Export service following Service Layer Pattern and SOLID principles.
 """
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from datetime import date, timedelta
+import csv
+import io
 import json
-from shared.models import MoodType
+from shared.models import MoodEntry, MoodType, Tag
+
+# Rows per page read for the streamed CSV export
+_CSV_BATCH_SIZE = 500
 
 
 class ExportService:
@@ -32,64 +37,92 @@ class ExportService:
             'moods': []
         }
         
+        tags_by_mood = self.tag_repository.get_tags_for_moods([mood.id for mood in moods])
         for mood in moods:
-            tags = self.tag_repository.get_mood_tags(mood.id)
             mood_data = mood.to_dict()
-            mood_data['tags'] = [tag.name for tag in tags]
+            mood_data['tags'] = [tag.name for tag in tags_by_mood[mood.id]]
             export_data['moods'].append(mood_data)
         
         return export_data
 
-    def export_to_csv(self, user_id: int, days: int = 30) -> str:
-        """Export mood data to CSV format."""
+    def export_to_csv(self, user_id: int, days: int = 30) -> Iterator[str]:
+        """
+        Export mood data to CSV format.
+
+        Returns an iterator yielding the CSV a batch of lines at a time so the
+        response can be streamed. Each batch is read on its own short
+        connection checkout, released before anything is sent, so slow
+        clients never hold a pooled connection. The first batch is read
+        before returning, so database errors there become a normal error
+        response instead of a truncated body.
+        """
         end_date = date.today()
         start_date = end_date - timedelta(days=days)
         
-        moods = self.mood_repository.find_by_user_and_date_range(user_id, start_date, end_date)
-        
+        first_page = self._csv_page(user_id, start_date, end_date, after=None)
+        return self._csv_chunks(user_id, start_date, end_date, first_page)
+
+    def _csv_page(self, user_id: int, start_date: date, end_date: date, after: Optional[Tuple]) -> Tuple[List[MoodEntry], Dict[int, List[Tag]]]:
+        """Read one page of moods and their tags on a single short checkout."""
+        with self.mood_repository.transaction():
+            moods = self.mood_repository.find_page_by_user_and_date_range(
+                user_id, start_date, end_date, after=after, limit=_CSV_BATCH_SIZE
+            )
+            tags_by_mood = self.tag_repository.get_tags_for_moods([mood.id for mood in moods])
+        return moods, tags_by_mood
+
+    def _csv_chunks(self, user_id: int, start_date: date, end_date: date, page: Tuple[List[MoodEntry], Dict[int, List[Tag]]]) -> Iterator[str]:
+        """Yield the CSV header, then one chunk per page, fetching pages as the client reads."""
         # CSV header
-        csv_lines = ['Date,Time,Mood,MoodValue,Notes,Triggers,Tags']
+        yield 'Date,Time,Mood,MoodValue,Notes,Triggers,Tags\n'
         
-        for mood in moods:
-            tags = self.tag_repository.get_mood_tags(mood.id)
-            tag_names = ';'.join([tag.name for tag in tags])
+        moods, tags_by_mood = page
+        while moods:
+            # csv.writer formats and quotes a whole batch in C
+            buffer = io.StringIO()
+            csv.writer(buffer, lineterminator='\n').writerows(
+                (
+                    mood.date.isoformat(),
+                    mood.timestamp.time().isoformat(timespec='seconds'),
+                    mood.mood,
+                    mood.mood_value,
+                    mood.notes,
+                    mood.triggers,
+                    ';'.join([tag.name for tag in tags_by_mood[mood.id]])
+                )
+                for mood in moods
+            )
+            yield buffer.getvalue()
             
-            csv_lines.append(
-                f"{mood.date.isoformat()},"
-                f"{mood.timestamp.strftime('%H:%M:%S')},"
-                f"{mood.mood},"
-                f"{mood.mood_value},"
-                f'"{mood.notes}",'
-                f'"{mood.triggers}",'
-                f'"{tag_names}"'
+            if len(moods) < _CSV_BATCH_SIZE:
+                break
+            last = moods[-1]
+            moods, tags_by_mood = self._csv_page(
+                user_id, start_date, end_date, after=(last.date, last.timestamp, last.id)
             )
-        
-        return '\n'.join(csv_lines)
 
     def get_summary_stats(self, user_id: int, days: int = 30) -> Dict[str, Any]:
         """Get summary statistics for export."""
         end_date = date.today()
         start_date = end_date - timedelta(days=days)
         
-        moods = self.mood_repository.find_by_user_and_date_range(user_id, start_date, end_date)
+        # Counted in SQL; the average is derived from the per-mood counts
+        mood_counts = self.mood_repository.count_by_mood(user_id, start_date, end_date)
+        total = sum(mood_counts.values())
         
-        if not moods:
+        if not total:
             return {
                 'total_entries': 0,
                 'average_mood': None,
                 'most_common_mood': None
             }
         
-        avg_value = sum(MoodType.get_value(m.mood) for m in moods) / len(moods)
-        
-        mood_counts = {}
-        for mood in moods:
-            mood_counts[mood.mood] = mood_counts.get(mood.mood, 0) + 1
-        
-        most_common = max(mood_counts.items(), key=lambda x: x[1])[0]
+        avg_value = sum(MoodType.get_value(m) * n for m, n in mood_counts.items()) / total
+        # Counts arrive most frequent first, ties broken by mood
+        most_common = next(iter(mood_counts))
         
         return {
-            'total_entries': len(moods),
+            'total_entries': total,
             'average_mood': round(avg_value, 2),
             'most_common_mood': most_common,
             'mood_distribution': mood_counts
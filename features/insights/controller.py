@@ -1,6 +1,7 @@
 """
 Insights controller following Controller Pattern and SOLID principles.
 """
+from datetime import date
 from flask import Blueprint
 from flask_login import current_user
 from features.auth.controller import login_required_api
@@ -20,12 +21,12 @@ class InsightsController:
         @login_required_api
         def get_insights():
             """Get personalized insights."""
-            data = self.service.generate_insights(current_user.id)
-            return {'success': True, 'data': data}, 200
+            insights = self.service.generate_insights(current_user.id, today=date.today())
+            return {'success': True, 'data': [insight.to_dict() for insight in insights]}, 200
 
         @self.blueprint.route('/tag-correlations', methods=['GET'])
         @login_required_api
         def get_tag_correlations():
             """Get tag-mood correlations."""
-            data = self.service.get_tag_correlations(current_user.id)
+            data = self.service.get_tag_correlations(current_user.id, today=date.today())
             return {'success': True, 'data': data}, 200
@@ -1,11 +1,23 @@
 """
 Mood repository following Repository Pattern and SOLID principles.
 """
-from typing import Optional, Dict, Any, List
-from datetime import date
+from typing import Optional, Dict, Any, List, Tuple
+from datetime import date, datetime, timedelta
+from psycopg.rows import args_row
 from core.base_repository import BaseRepository
 from shared.models import MoodEntry
 
+# Columns in MoodEntry field order, so rows map positionally onto the entity
+_ENTRY_COLUMNS = (
+    'id, user_id, date, mood, notes, triggers, context_location, '
+    'context_activity, context_weather, context_notes, timestamp, created_at'
+)
+
+# Columns a client may change through update_mood
+_UPDATABLE_FIELDS = frozenset({
+    'mood', 'notes', 'triggers', 'context_location', 'context_activity', 'context_weather', 'context_notes'
+})
+
 
 class MoodRepository(BaseRepository[MoodEntry, int]):
     """Mood repository for managing mood data."""
@@ -54,62 +66,256 @@ class MoodRepository(BaseRepository[MoodEntry, int]):
             row = cursor.fetchone()
             return self._to_entity(row)
 
-    def find_by_user(self, user_id: int, limit: Optional[int] = None, offset: int = 0) -> List[MoodEntry]:
+    def _fetch_entries(self, query: str, params) -> List[MoodEntry]:
+        """Run a SELECT of _ENTRY_COLUMNS, building entries from row tuples."""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            query = 'SELECT * FROM moods WHERE user_id = %s ORDER BY date DESC, timestamp DESC'
-            params = [user_id]
-            if limit:
-                query += ' LIMIT %s'
-                params.append(limit)
-            if offset:
-                query += ' OFFSET %s'
-                params.append(offset)
+            cursor = conn.cursor(row_factory=args_row(MoodEntry))
             cursor.execute(query, params)
-            rows = cursor.fetchall()
-            return [self._to_entity(row) for row in rows]
+            return cursor.fetchall()
+
+    def find_by_user(self, user_id: int, limit: Optional[int] = None, offset: int = 0) -> List[MoodEntry]:
+        query = f'SELECT {_ENTRY_COLUMNS} FROM moods WHERE user_id = %s ORDER BY date DESC, timestamp DESC'
+        params = [user_id]
+        if limit:
+            query += ' LIMIT %s'
+            params.append(limit)
+        if offset:
+            query += ' OFFSET %s'
+            params.append(offset)
+        return self._fetch_entries(query, params)
 
     def find_by_user_and_date_range(self, user_id: int, start_date: date, end_date: date) -> List[MoodEntry]:
+        return self._fetch_entries(f'''
+            SELECT {_ENTRY_COLUMNS} FROM moods WHERE user_id = %s AND date >= %s AND date <= %s
+            ORDER BY date DESC, timestamp DESC
+        ''', (user_id, start_date, end_date))
+
+    def find_page_by_user_and_date_range(self, user_id: int, start_date: date, end_date: date, after: Optional[Tuple[date, datetime, int]] = None, limit: int = 500) -> List[MoodEntry]:
+        """
+        Get one page of a user's moods in a date range, newest first.
+
+        Keyset pagination: pass the (date, timestamp, id) of the previous
+        page's last entry as after. Each page is an independent short query,
+        so no connection or cursor is held between pages.
+        """
+        query = f'SELECT {_ENTRY_COLUMNS} FROM moods WHERE user_id = %s AND date >= %s AND date <= %s'
+        params = [user_id, start_date, end_date]
+        if after:
+            query += ' AND (date, timestamp, id) < (%s, %s, %s)'
+            params.extend(after)
+        query += ' ORDER BY date DESC, timestamp DESC, id DESC LIMIT %s'
+        params.append(limit)
+        return self._fetch_entries(query, params)
+
+    def find_by_user_and_date(self, user_id: int, target_date: date) -> List[MoodEntry]:
+        return self._fetch_entries(
+            f'SELECT {_ENTRY_COLUMNS} FROM moods WHERE user_id = %s AND date = %s ORDER BY timestamp DESC',
+            (user_id, target_date)
+        )
+
+    def count_by_user_and_date(self, user_id: int, target_date: date, cap: Optional[int] = None) -> int:
+        """Count a user's moods on a date, stopping the scan once cap rows are seen."""
         with self.get_connection() as conn:
             cursor = conn.cursor()
+            # LIMIT NULL means no limit, so one statement serves both cases
             cursor.execute('''
-                SELECT * FROM moods WHERE user_id = %s AND date >= %s AND date <= %s
-                ORDER BY date DESC, timestamp DESC
+                SELECT COUNT(*) AS n FROM (
+                    SELECT 1 FROM moods WHERE user_id = %s AND date = %s LIMIT %s
+                ) AS capped
+            ''', (user_id, target_date, cap))
+            return cursor.fetchone()['n']
+
+    def insight_signals(self, user_id: int, start_date: date, end_date: date) -> Dict[str, Any]:
+        """
+        Everything the insights service needs in one round trip.
+
+        Returns:
+            Dictionary with the range's 'count' and 'average', the 'best_hour'
+            by average mood (None if no entries carry an hour) and the user's
+            all-time 'total' entries
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                WITH w AS (
+                    SELECT mood_value, hour FROM moods
+                    WHERE user_id = %s AND date >= %s AND date <= %s
+                )
+                SELECT
+                    (SELECT COUNT(*) FROM w) AS count,
+                    (SELECT AVG(mood_value)::float8 FROM w) AS average,
+                    (SELECT hour FROM w WHERE hour IS NOT NULL
+                     GROUP BY hour ORDER BY AVG(mood_value) DESC, hour LIMIT 1) AS best_hour,
+                    (SELECT n FROM user_mood_counts WHERE user_id = %s) AS total
+            ''', (user_id, start_date, end_date, user_id))
+            row = cursor.fetchone()
+            row['total'] = row['total'] or 0
+            return row
+
+    def mood_trend(self, user_id: int, start_date: date, end_date: date) -> Tuple[int, Optional[float]]:
+        """
+        Least-squares slope of mood value over entries in a date range.
+
+        x is each entry's position in newest-first order, matching the
+        ordering of find_by_user_and_date_range.
+
+        Returns:
+            Tuple of (entry count, slope or None when it is undefined)
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT COUNT(*) AS n, regr_slope(mood_value, x) AS slope FROM (
+                    SELECT mood_value, ROW_NUMBER() OVER (ORDER BY date DESC, timestamp DESC) - 1 AS x
+                    FROM moods
+                    WHERE user_id = %s AND date >= %s AND date <= %s
+                ) AS ranked
             ''', (user_id, start_date, end_date))
-            rows = cursor.fetchall()
-            return [self._to_entity(row) for row in rows]
+            row = cursor.fetchone()
+            return row['n'], row['slope']
 
-    def find_by_user_and_date(self, user_id: int, target_date: date) -> List[MoodEntry]:
+    def count_by_mood(self, user_id: int, start_date: date, end_date: date) -> Dict[str, int]:
+        """Count a user's moods per mood value in a date range, most frequent first."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            # Ties break on mood so the first key is stable across calls
+            cursor.execute('''
+                SELECT mood, COUNT(*) AS n FROM moods
+                WHERE user_id = %s AND date >= %s AND date <= %s
+                GROUP BY mood
+                ORDER BY n DESC, mood
+            ''', (user_id, start_date, end_date))
+            return {row['mood']: row['n'] for row in cursor.fetchall()}
+
+    def hourly_averages(self, user_id: int, start_date: date, end_date: date) -> Dict[int, float]:
+        """Average mood value per hour of day in a date range."""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute('SELECT * FROM moods WHERE user_id = %s AND date = %s ORDER BY timestamp DESC', (user_id, target_date))
-            rows = cursor.fetchall()
-            return [self._to_entity(row) for row in rows]
+            cursor.execute('''
+                SELECT hour, AVG(mood_value) AS avg_value FROM moods
+                WHERE user_id = %s AND date >= %s AND date <= %s AND hour IS NOT NULL
+                GROUP BY hour
+            ''', (user_id, start_date, end_date))
+            return {row['hour']: float(row['avg_value']) for row in cursor.fetchall()}
+
+    def average_mood_windows(self, user_id: int, windows: List[int], end_date: date) -> Dict[int, Dict[str, Any]]:
+        """
+        Average mood over several trailing windows in a single query.
+
+        Args:
+            user_id: User identifier
+            windows: Window lengths in days, each ending at end_date
+            end_date: Last day included in every window
+
+        Returns:
+            Dictionary mapping window length to {'average', 'count'}
+        """
+        ranges = [(end_date - timedelta(days=days), end_date) for days in windows]
+        return dict(zip(windows, self.average_mood_ranges(user_id, ranges)))
+
+    def average_mood_ranges(self, user_id: int, ranges: List[Tuple[date, date]]) -> List[Dict[str, Any]]:
+        """
+        Average mood over several date ranges in a single query.
+
+        Scans the span covering all ranges once and computes each range's
+        average and count with conditional aggregation.
+
+        Args:
+            user_id: User identifier
+            ranges: Inclusive (start_date, end_date) pairs
+
+        Returns:
+            List of {'average', 'count'} in the same order as ranges
+        """
+        columns = []
+        params = []
+        for i, (start, end) in enumerate(ranges):
+            columns.append(f'AVG(CASE WHEN date BETWEEN %s AND %s THEN mood_value END) AS avg_{i}')
+            columns.append(f'COUNT(CASE WHEN date BETWEEN %s AND %s THEN 1 END) AS count_{i}')
+            params.extend([start, end, start, end])
+        params.extend([user_id, min(start for start, _ in ranges), max(end for _, end in ranges)])
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f'''
+                SELECT {", ".join(columns)} FROM moods
+                WHERE user_id = %s AND date >= %s AND date <= %s
+            ''', params)
+            row = cursor.fetchone()
+            return [
+                {
+                    'average': float(row[f'avg_{i}']) if row[f'avg_{i}'] is not None else None,
+                    'count': row[f'count_{i}']
+                }
+                for i in range(len(ranges))
+            ]
 
     def get_most_recent(self, user_id: int) -> Optional[MoodEntry]:
         moods = self.find_by_user(user_id, limit=1)
         return moods[0] if moods else None
 
-    def update_mood(self, mood_id: int, user_id: int, updates: Dict[str, Any]) -> Optional[MoodEntry]:
-        allowed_fields = {'mood', 'notes', 'triggers', 'context_location', 'context_activity', 'context_weather', 'context_notes'}
-        update_fields = {k: v for k, v in updates.items() if k in allowed_fields}
+    def update_mood(self, mood_id: int, user_id: int, updates: Dict[str, Any]) -> Tuple[Optional[int], Optional[MoodEntry]]:
+        """
+        Update a user's mood in one statement.
+
+        Returns:
+            Tuple of (owner user_id or None if the mood doesn't exist,
+            updated entry or None if it isn't owned by user_id)
+        """
+        update_fields = {k: v for k, v in updates.items() if k in _UPDATABLE_FIELDS}
         if not update_fields:
-            return self.find_by_id(mood_id)
+            mood = self.find_by_id(mood_id)
+            if not mood:
+                return None, None
+            return mood.user_id, mood if mood.user_id == user_id else None
         set_clauses = [f"{key} = %s" for key in update_fields.keys()]
-        values = list(update_fields.values())
+        values = [mood_id]
+        values.extend(update_fields.values())
         values.extend([mood_id, user_id])
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            query = f'UPDATE moods SET {", ".join(set_clauses)} WHERE id = %s AND user_id = %s RETURNING *'
+            query = f'''
+                WITH existing AS (SELECT user_id AS owner FROM moods WHERE id = %s),
+                     upd AS (UPDATE moods SET {", ".join(set_clauses)} WHERE id = %s AND user_id = %s RETURNING *)
+                SELECT existing.owner, upd.* FROM existing LEFT JOIN upd ON TRUE
+            '''
             cursor.execute(query, values)
             row = cursor.fetchone()
-            return self._to_entity(row) if row else None
+            if not row:
+                return None, None
+            return row['owner'], self._to_entity(row) if row['id'] is not None else None
+
+    def delete_by_user(self, mood_id: int, user_id: int) -> Tuple[Optional[int], bool]:
+        """
+        Delete a user's mood in one statement.
 
-    def delete_by_user(self, mood_id: int, user_id: int) -> bool:
+        Returns:
+            Tuple of (owner user_id or None if the mood doesn't exist,
+            whether the mood was deleted)
+        """
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute('DELETE FROM moods WHERE id = %s AND user_id = %s', (mood_id, user_id))
-            return cursor.rowcount > 0
+            cursor.execute('''
+                WITH existing AS (SELECT user_id AS owner FROM moods WHERE id = %s),
+                     del AS (DELETE FROM moods WHERE id = %s AND user_id = %s RETURNING id)
+                SELECT existing.owner, del.id AS deleted_id FROM existing LEFT JOIN del ON TRUE
+            ''', (mood_id, mood_id, user_id))
+            row = cursor.fetchone()
+            if not row:
+                return None, False
+            return row['owner'], row['deleted_id'] is not None
+
+    def data_version(self, user_id: int) -> int:
+        """Trigger-maintained counter bumped by every write to the user's moods."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT version FROM user_mood_counts WHERE user_id = %s', (user_id,))
+            row = cursor.fetchone()
+            return row['version'] if row else 0
 
     def count_by_user(self, user_id: int) -> int:
-        return self.count({'user_id': user_id})
+        # Reads the trigger-maintained counter instead of scanning moods
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT n FROM user_mood_counts WHERE user_id = %s', (user_id,))
+            row = cursor.fetchone()
+            return row['n'] if row else 0
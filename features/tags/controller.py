@@ -1,7 +1,7 @@
 """
 Tag controller following Controller Pattern and SOLID principles.
 """
-from flask import request
+from flask import make_response, request
 from flask_login import current_user
 from core.base_controller import BaseController
 from features.auth.controller import login_required_api
@@ -15,42 +15,52 @@ class TagController(BaseController):
 
     def register_routes(self):
         """Register all tag endpoints."""
-
-        @self.blueprint.route('', methods=['GET'])
-        @login_required_api
-        @self.handle_request
-        def get_all_tags():
-            """Get all tags grouped by category."""
-            tags = self.service.get_all_tags_grouped()
-            return self.success_response(data={'categories': tags})
-
-        @self.blueprint.route('', methods=['POST'])
-        @login_required_api
-        @self.handle_request
-        def create_tag():
-            """Create new tag."""
-            data = self.get_json_data(required_fields=['name', 'category'])
-            tag = self.service.create_tag(
-                name=data['name'],
-                category=data['category'],
-                color=data.get('color', '#808080'),
-                icon=data.get('icon', 'tag')
+        routes = (
+            ('', 'get_all_tags', self._get_all_tags, ['GET']),
+            ('', 'create_tag', self._create_tag, ['POST']),
+            ('/mood/<int:mood_id>', 'get_mood_tags', self._get_mood_tags, ['GET']),
+            ('/mood/<int:mood_id>', 'set_mood_tags', self._set_mood_tags, ['PUT']),
+        )
+        for rule, endpoint, handler, methods in routes:
+            self.blueprint.add_url_rule(
+                rule, endpoint,
+                login_required_api(self.handle_request(handler)),
+                methods=methods
             )
-            return self.success_response(data=tag.to_dict(), message='Tag created successfully')
-
-        @self.blueprint.route('/mood/<int:mood_id>', methods=['GET'])
-        @login_required_api
-        @self.handle_request
-        def get_mood_tags(mood_id):
-            """Get tags for specific mood."""
-            tags = self.service.get_mood_tags(mood_id)
-            return self.success_response(data=[tag.to_dict() for tag in tags])
-
-        @self.blueprint.route('/mood/<int:mood_id>', methods=['PUT'])
-        @login_required_api
-        @self.handle_request
-        def set_mood_tags(mood_id):
-            """Set tags for mood."""
-            data = self.get_json_data(required_fields=['tags'])
-            self.service.set_mood_tags(mood_id, data['tags'])
-            return self.success_response(message='Tags updated successfully')
+
+    def _get_all_tags(self):
+        """Get all tags grouped by category."""
+        version = self.service.get_tags_version()
+        # Clients revalidating with an unchanged ETag skip the payload entirely;
+        # weak comparison, since gzipping proxies rewrite the tag as W/"..."
+        if request.if_none_match.contains_weak(version):
+            response = make_response('', 304)
+            response.set_etag(version)
+            return response, 304
+
+        tags = self.service.get_all_tags_grouped(version)
+        response, status = self.success_response(data={'categories': tags})
+        response.set_etag(version)
+        return response, status
+
+    def _create_tag(self):
+        """Create new tag."""
+        data = self.get_json_data(required_fields=['name', 'category'])
+        tag = self.service.create_tag(
+            name=data['name'],
+            category=data['category'],
+            color=data.get('color', '#808080'),
+            icon=data.get('icon', 'tag')
+        )
+        return self.success_response(data=tag.to_dict(), message='Tag created successfully')
+
+    def _get_mood_tags(self, mood_id):
+        """Get tags for specific mood."""
+        tags = self.service.get_mood_tags(mood_id)
+        return self.success_response(data=[tag.to_dict() for tag in tags])
+
+    def _set_mood_tags(self, mood_id):
+        """Set tags for mood."""
+        data = self.get_json_data(required_fields=['tags'])
+        self.service.set_mood_tags(mood_id, data['tags'])
+        return self.success_response(message='Tags updated successfully')
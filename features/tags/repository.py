@@ -2,6 +2,7 @@
 Tag repository following Repository Pattern and SOLID principles.
 """
 from typing import Optional, Dict, Any, List
+from datetime import date
 from core.base_repository import BaseRepository
 from shared.models import Tag
 
@@ -49,21 +50,35 @@ class TagRepository(BaseRepository[Tag, int]):
             grouped[tag.category].append(tag)
         return grouped
 
-    def create_or_get(self, name: str, category: str, color: str = '#808080', icon: str = 'tag') -> Tag:
-        """Create tag or get existing."""
-        existing = self.find_by_name(name)
-        if existing:
-            return existing
+    def get_version(self) -> str:
+        """Cheap version stamp for the tags table; tags are only ever added."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT COALESCE(MAX(id), 0) AS max_id, COUNT(*) AS n FROM tags')
+            row = cursor.fetchone()
+            return f"{row['max_id']}-{row['n']}"
 
+    def create_or_get(self, name: str, category: str, color: str = '#808080', icon: str = 'tag') -> Tag:
+        """Create tag or get existing in a single statement."""
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute('''
-                INSERT INTO tags (name, category, color, icon)
-                VALUES (%s, %s, %s, %s)
-                RETURNING *
-            ''', (name, category, color, icon))
+                WITH ins AS (
+                    INSERT INTO tags (name, category, color, icon)
+                    VALUES (%s, %s, %s, %s)
+                    ON CONFLICT (name) DO NOTHING
+                    RETURNING *
+                )
+                SELECT * FROM ins
+                UNION ALL
+                SELECT * FROM tags WHERE name = %s
+                LIMIT 1
+            ''', (name, category, color, icon, name))
             row = cursor.fetchone()
-            return self._to_entity(row)
+        if row is None:
+            # A concurrent insert committed after this statement's snapshot
+            return self.find_by_name(name)
+        return self._to_entity(row)
 
     def add_mood_tag(self, mood_id: int, tag_id: int) -> None:
         """Associate tag with mood."""
@@ -75,6 +90,18 @@ class TagRepository(BaseRepository[Tag, int]):
                 ON CONFLICT DO NOTHING
             ''', (mood_id, tag_id))
 
+    def add_mood_tags_by_name(self, mood_id: int, tag_names: List[str]) -> None:
+        """Associate existing tags with mood by name in a single statement."""
+        if not tag_names:
+            return
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                INSERT INTO mood_tags (mood_id, tag_id)
+                SELECT %s, id FROM tags WHERE name = ANY(%s)
+                ON CONFLICT DO NOTHING
+            ''', (mood_id, list(tag_names)))
+
     def remove_mood_tag(self, mood_id: int, tag_id: int) -> None:
         """Remove tag from mood."""
         with self.get_connection() as conn:
@@ -96,6 +123,38 @@ class TagRepository(BaseRepository[Tag, int]):
             rows = cursor.fetchall()
             return [self._to_entity(row) for row in rows]
 
+    def get_tags_for_moods(self, mood_ids: List[int]) -> Dict[int, List[Tag]]:
+        """Get tags for many moods in one query, keyed by mood id."""
+        tags_by_mood: Dict[int, List[Tag]] = {mood_id: [] for mood_id in mood_ids}
+        if not mood_ids:
+            return tags_by_mood
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT mt.mood_id, t.* FROM mood_tags mt
+                JOIN tags t ON t.id = mt.tag_id
+                WHERE mt.mood_id = ANY(%s)
+            ''', (list(mood_ids),))
+            for row in cursor.fetchall():
+                tags_by_mood[row['mood_id']].append(self._to_entity(row))
+        return tags_by_mood
+
+    def get_tag_mood_stats(self, user_id: int, start_date: date, end_date: date, min_count: int = 1) -> List[Dict[str, Any]]:
+        """Get {'tag', 'average_mood', 'count'} per tag for a user's moods in a date range, best first."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT t.name AS tag, ROUND(AVG(m.mood_value), 2)::float8 AS average_mood, COUNT(*) AS count
+                FROM moods m
+                JOIN mood_tags mt ON mt.mood_id = m.id
+                JOIN tags t ON t.id = mt.tag_id
+                WHERE m.user_id = %s AND m.date >= %s AND m.date <= %s
+                GROUP BY t.name
+                HAVING COUNT(*) >= %s
+                ORDER BY average_mood DESC, count DESC
+            ''', (user_id, start_date, end_date, min_count))
+            return cursor.fetchall()
+
     def clear_mood_tags(self, mood_id: int) -> None:
         """Remove all tags from mood."""
         with self.get_connection() as conn:
@@ -1,7 +1,7 @@
 """
 Tag service following Service Layer Pattern and SOLID principles.
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 from core.base_service import BaseService
 from shared.models import Tag
 from shared.exceptions import ValidationError
@@ -12,6 +12,8 @@ class TagService(BaseService[Tag, int]):
 
     def __init__(self, repository):
         super().__init__(repository)
+        # (version, grouped tags) from the last full load
+        self._grouped_cache: Optional[Tuple[str, Dict[str, List[Dict[str, Any]]]]] = None
 
     def _validate_create(self, data: Dict[str, Any]) -> None:
         required = ['name', 'category']
@@ -22,12 +24,22 @@ class TagService(BaseService[Tag, int]):
     def _validate_update(self, id: int, data: Dict[str, Any]) -> None:
         pass
 
-    def get_all_tags_grouped(self) -> Dict[str, List[Dict[str, Any]]]:
-        """Get all tags grouped by category."""
+    def get_tags_version(self) -> str:
+        """Version string that changes whenever a tag is added."""
+        return self.repository.get_version()
+
+    def get_all_tags_grouped(self, version: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """Get all tags grouped by category, reloading only when the tags version changes."""
+        version = version or self.get_tags_version()
+        cached = self._grouped_cache
+        if cached and cached[0] == version:
+            return cached[1]
+
         grouped = self.repository.get_all_grouped_by_category()
         result = {}
         for category, tags in grouped.items():
             result[category] = [tag.to_dict() for tag in tags]
+        self._grouped_cache = (version, result)
         return result
 
     def create_tag(self, name: str, category: str, color: str = '#808080', icon: str = 'tag') -> Tag:
@@ -37,15 +49,14 @@ class TagService(BaseService[Tag, int]):
 
     def add_tags_to_mood(self, mood_id: int, tag_names: List[str]) -> None:
         """Add tags to mood by tag names."""
-        for tag_name in tag_names:
-            tag = self.repository.find_by_name(tag_name)
-            if tag:
-                self.repository.add_mood_tag(mood_id, tag.id)
+        # Unknown names are skipped by the join
+        self.repository.add_mood_tags_by_name(mood_id, tag_names)
 
     def set_mood_tags(self, mood_id: int, tag_names: List[str]) -> None:
         """Replace all tags for a mood."""
-        self.repository.clear_mood_tags(mood_id)
-        self.add_tags_to_mood(mood_id, tag_names)
+        with self.repository.transaction():
+            self.repository.clear_mood_tags(mood_id)
+            self.add_tags_to_mood(mood_id, tag_names)
 
     def get_mood_tags(self, mood_id: int) -> List[Tag]:
         """Get all tags for a mood."""
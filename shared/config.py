@@ -17,6 +17,10 @@ class Config:
 
     # Database
     DATABASE_URL: str = os.environ.get('DATABASE_URL', '')
+    DB_POOL_MIN_SIZE: int = int(os.environ.get('DB_POOL_MIN_SIZE', 5))
+    DB_POOL_MAX_SIZE: int = int(os.environ.get('DB_POOL_MAX_SIZE', 20))
+    # Executions before psycopg prepares a query server-side (0 = first use)
+    DB_PREPARE_THRESHOLD: int = int(os.environ.get('DB_PREPARE_THRESHOLD', 0))
 
     # Flask
     SECRET_KEY: str = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
@@ -36,6 +40,10 @@ class Config:
     DEFAULT_PAGE_SIZE: int = 50
     MAX_PAGE_SIZE: int = 100
 
+    # Analytics result cache (per process)
+    ANALYTICS_CACHE_SIZE: int = int(os.environ.get('ANALYTICS_CACHE_SIZE', 1024))
+    ANALYTICS_CACHE_TTL: int = int(os.environ.get('ANALYTICS_CACHE_TTL', 300))
+
     @classmethod
     def validate(cls) -> None:
         """
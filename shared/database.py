@@ -3,12 +3,24 @@ Database connection and schema management following SOLID principles.
 
 Provides centralized database access with connection pooling and schema initialization.
 """
+import atexit
+import threading
 import psycopg
 from psycopg.rows import dict_row
+from psycopg_pool import ConnectionPool
 from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Generator, Any
 from shared.config import Config
 from shared.exceptions import DatabaseError
+from shared.models import MOOD_VALUE_SQL
+
+# Connection of the transaction currently open in this context, if any
+_active_connection: ContextVar = ContextVar('active_connection', default=None)
+
+# pg_trigger.tgtype of trg_user_mood_counts: ROW 1 | INSERT 4 | DELETE 8 | UPDATE 16
+# (AFTER sets no bit). Keep in sync with the CREATE TRIGGER events in initialize()
+_MOOD_COUNTS_TRIGGER_TYPE = 1 | 4 | 8 | 16
 
 
 class Database:
@@ -23,6 +35,36 @@ class Database:
         """Initialize database with configuration."""
         self.url = Config.DATABASE_URL
         self._initialized = False
+        self._pool = None
+        self._pool_lock = threading.Lock()
+
+    def _get_pool(self) -> ConnectionPool:
+        """Create the connection pool on first use."""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    # check= drops connections the server closed (restart, idle
+                    # timeout) before a request gets one
+                    self._pool = ConnectionPool(
+                        self.url,
+                        min_size=Config.DB_POOL_MIN_SIZE,
+                        max_size=Config.DB_POOL_MAX_SIZE,
+                        kwargs={
+                            'row_factory': dict_row,
+                            'prepare_threshold': Config.DB_PREPARE_THRESHOLD
+                        },
+                        check=ConnectionPool.check_connection,
+                        open=True
+                    )
+                    atexit.register(self.close)
+        return self._pool
+
+    def close(self) -> None:
+        """Close the connection pool, if one was opened."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.close()
+                self._pool = None
 
     @contextmanager
     def get_connection(self) -> Generator[Any, None, None]:
@@ -32,7 +74,7 @@ class Database:
         Provides connection as context manager with automatic:
         - Commit on success
         - Rollback on exception
-        - Connection cleanup
+        - Connection returned to the pool
 
         Yields:
             Database connection with dict_row factory
@@ -40,27 +82,44 @@ class Database:
         Raises:
             DatabaseError: If connection fails
         """
+        active = _active_connection.get()
+        if active is not None:
+            # Inside transaction(): reuse its connection, commit happens there
+            yield active
+            return
+
         if not self.url:
             raise DatabaseError("DATABASE_URL not configured")
 
-        conn = None
+        # The pool commits on success, rolls back on exception and
+        # takes the connection back afterwards
         try:
-            conn = psycopg.connect(self.url, row_factory=dict_row)
-            yield conn
+            with self._get_pool().connection() as conn:
+                yield conn
         except psycopg.Error as e:
-            if conn:
-                conn.rollback()
             raise DatabaseError(f"Database error: {str(e)}")
-        except Exception as e:
-            if conn:
-                conn.rollback()
-            raise
-        else:
-            if conn:
-                conn.commit()
-        finally:
-            if conn:
-                conn.close()
+
+    @contextmanager
+    def transaction(self) -> Generator[Any, None, None]:
+        """
+        Run several operations on one connection and one transaction.
+
+        Every get_connection() call made inside the block reuses the same
+        connection, which is committed once when the outermost block exits.
+
+        Yields:
+            Database connection with dict_row factory
+        """
+        if _active_connection.get() is not None:
+            yield _active_connection.get()
+            return
+
+        with self.get_connection() as conn:
+            token = _active_connection.set(conn)
+            try:
+                yield conn
+            finally:
+                _active_connection.reset(token)
 
     def initialize(self) -> None:
         """
@@ -111,6 +170,17 @@ class Database:
                     )
                 ''')
 
+                # Stored hour-of-day for time-based analytics
+                cursor.execute('''
+                    ALTER TABLE moods ADD COLUMN IF NOT EXISTS hour SMALLINT
+                    GENERATED ALWAYS AS (EXTRACT(HOUR FROM timestamp)::smallint) STORED
+                ''')
+                # Stored 1-7 mood value so aggregates skip the per-row CASE on mood
+                cursor.execute(f'''
+                    ALTER TABLE moods ADD COLUMN IF NOT EXISTS mood_value SMALLINT
+                    GENERATED ALWAYS AS (({MOOD_VALUE_SQL.format(column='mood')})::smallint) STORED
+                ''')
+
                 # Tags table
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS tags (
@@ -132,10 +202,79 @@ class Database:
                     )
                 ''')
 
+                # Per-user mood counter and data version maintained by triggers on moods
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS user_mood_counts (
+                        user_id INTEGER PRIMARY KEY REFERENCES users(id) ON DELETE CASCADE,
+                        n BIGINT NOT NULL DEFAULT 0
+                    )
+                ''')
+                # Bumped on every write so caches can key on it across processes
+                cursor.execute('''
+                    ALTER TABLE user_mood_counts ADD COLUMN IF NOT EXISTS version BIGINT NOT NULL DEFAULT 0
+                ''')
+                cursor.execute('''
+                    CREATE OR REPLACE FUNCTION user_mood_counts_sync() RETURNS TRIGGER AS $$
+                    BEGIN
+                        -- moods.user_id is nullable; ownerless rows have no counter
+                        IF TG_OP = 'DELETE' THEN
+                            IF OLD.user_id IS NULL THEN
+                                RETURN OLD;
+                            END IF;
+                        ELSIF NEW.user_id IS NULL THEN
+                            RETURN NEW;
+                        END IF;
+
+                        IF TG_OP = 'INSERT' THEN
+                            INSERT INTO user_mood_counts (user_id, n, version) VALUES (NEW.user_id, 1, 1)
+                            ON CONFLICT (user_id) DO UPDATE
+                            SET n = user_mood_counts.n + 1, version = user_mood_counts.version + 1;
+                            RETURN NEW;
+                        ELSIF TG_OP = 'UPDATE' THEN
+                            UPDATE user_mood_counts SET version = version + 1 WHERE user_id = NEW.user_id;
+                            RETURN NEW;
+                        ELSE
+                            UPDATE user_mood_counts SET n = n - 1, version = version + 1 WHERE user_id = OLD.user_id;
+                            RETURN OLD;
+                        END IF;
+                    END;
+                    $$ LANGUAGE plpgsql
+                ''')
+                # Create the trigger and backfill only when it is missing or its events
+                # changed: both lock moods, and the backfill scans it, so they must not
+                # run on every process start
+                cursor.execute('''
+                    SELECT tgtype FROM pg_trigger
+                    WHERE tgrelid = 'moods'::regclass AND tgname = 'trg_user_mood_counts'
+                ''')
+                existing = cursor.fetchone()
+                if existing is None or existing['tgtype'] != _MOOD_COUNTS_TRIGGER_TYPE:
+                    cursor.execute('DROP TRIGGER IF EXISTS trg_user_mood_counts ON moods')
+                    cursor.execute('''
+                        CREATE TRIGGER trg_user_mood_counts
+                        AFTER INSERT OR UPDATE OR DELETE ON moods
+                        FOR EACH ROW EXECUTE FUNCTION user_mood_counts_sync()
+                    ''')
+                    # Backfill counts for rows written before the trigger existed;
+                    # the trigger's lock is held until commit, so no write slips between
+                    cursor.execute('''
+                        INSERT INTO user_mood_counts (user_id, n)
+                        SELECT user_id, COUNT(*) FROM moods WHERE user_id IS NOT NULL GROUP BY user_id
+                        ON CONFLICT (user_id) DO UPDATE SET n = EXCLUDED.n
+                    ''')
+
                 # Indexes for performance
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_moods_user_date ON moods(user_id, date DESC)')
+                # Covering index: per-user range aggregates become index-only scans
+                cursor.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_moods_user_date_values
+                    ON moods(user_id, date DESC) INCLUDE (mood, mood_value, hour, id)
+                ''')
+                cursor.execute('DROP INDEX IF EXISTS idx_moods_user_date')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_moods_timestamp ON moods(timestamp DESC)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_moods_user_id ON moods(user_id)')
+                # user_id lookups use the leading column of the covering index
+                cursor.execute('DROP INDEX IF EXISTS idx_moods_user_id')
+                # Hour queries filter on a date range; the covering index carries hour
+                cursor.execute('DROP INDEX IF EXISTS idx_moods_user_hour')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_tags_category ON tags(category)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_mood_tags_mood ON mood_tags(mood_id)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_mood_tags_tag ON mood_tags(tag_id)')
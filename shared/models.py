@@ -35,24 +35,33 @@ class MoodType(Enum):
         Returns:
             Numeric value (1=worst, 7=best)
         """
-        mood_values = {
-            cls.VERY_BAD.value: 1,
-            cls.BAD.value: 2,
-            cls.SLIGHTLY_BAD.value: 3,
-            cls.NEUTRAL.value: 4,
-            cls.SLIGHTLY_WELL.value: 5,
-            cls.WELL.value: 6,
-            cls.VERY_WELL.value: 7
-        }
-        return mood_values.get(mood_str, 4)
+        return MOOD_SCALE.get(mood_str, 4)
 
     @classmethod
     def is_valid(cls, mood_str: str) -> bool:
         """Check if mood string is valid."""
-        return mood_str in [m.value for m in cls]
+        return isinstance(mood_str, str) and mood_str in MOOD_SCALE
+
+
+# Mood string to numeric value (1=worst, 7=best); the single source for
+# get_value, MoodEntry.to_dict and MOOD_VALUE_SQL
+MOOD_SCALE = {
+    MoodType.VERY_BAD.value: 1,
+    MoodType.BAD.value: 2,
+    MoodType.SLIGHTLY_BAD.value: 3,
+    MoodType.NEUTRAL.value: 4,
+    MoodType.SLIGHTLY_WELL.value: 5,
+    MoodType.WELL.value: 6,
+    MoodType.VERY_WELL.value: 7
+}
+
+# SQL expression mapping a mood column to its 1-7 value
+MOOD_VALUE_SQL = 'CASE {{column}} {} ELSE 4 END'.format(
+    ' '.join(f"WHEN '{mood}' THEN {value}" for mood, value in MOOD_SCALE.items())
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """
     User domain model - Single Responsibility Principle.
@@ -76,7 +85,7 @@ class User:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class MoodEntry:
     """
     Mood entry domain model - Single Responsibility Principle.
@@ -114,7 +123,7 @@ class MoodEntry:
             'user_id': self.user_id,
             'date': self.date.isoformat(),
             'mood': self.mood,
-            'mood_value': self.mood_value,
+            'mood_value': MOOD_SCALE.get(self.mood, 4),
             'notes': self.notes,
             'triggers': self.triggers,
             'context': {
@@ -124,7 +133,7 @@ class MoodEntry:
                 'notes': self.context_notes
             },
             'timestamp': self.timestamp.isoformat(),
-            'hour': self.hour,
+            'hour': self.timestamp.hour,
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
         if self.tags is not None:
@@ -132,7 +141,7 @@ class MoodEntry:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class Tag:
     """
     Tag domain model - Single Responsibility Principle.
@@ -156,3 +165,23 @@ class Tag:
             'icon': self.icon,
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
+
+
+@dataclass(slots=True)
+class Insight:
+    """
+    Insight domain model - Single Responsibility Principle.
+
+    Represents a personalized insight generated from mood history.
+    """
+    type: str
+    message: str
+    priority: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for API responses."""
+        return {
+            'type': self.type,
+            'message': self.message,
+            'priority': self.priority
+        }
@@ -0,0 +1,115 @@
+import threading
+import pytest
+import shared.cache as cache_module
+from shared.cache import TTLCache
+
+
+class FakeClock:
+    """Stands in for the time module so expiry can be stepped deterministically"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache_module, 'time', fake)
+    return fake
+
+
+class TestTTLCache:
+
+    def test_miss_computes_and_hit_reuses(self, clock):
+        """Test a miss stores the computed value and a hit skips compute"""
+        cache = TTLCache(maxsize=4, ttl=60)
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return 'value'
+
+        assert cache.get_or_compute('k', compute) == 'value'
+        assert cache.get_or_compute('k', compute) == 'value'
+        assert len(calls) == 1
+
+    def test_entry_expires_after_ttl(self, clock):
+        """Test entries are recomputed once their TTL has passed"""
+        cache = TTLCache(maxsize=4, ttl=60)
+        cache.get_or_compute('k', lambda: 'old')
+
+        clock.now += 59
+        assert cache.get_or_compute('k', lambda: 'new') == 'old'
+
+        clock.now += 1
+        assert cache.get_or_compute('k', lambda: 'new') == 'new'
+
+    def test_evicts_least_recently_used(self, clock):
+        """Test the least recently used entry is evicted past maxsize"""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.get_or_compute('a', lambda: 1)
+        cache.get_or_compute('b', lambda: 2)
+        # Touch 'a' so 'b' becomes the least recently used
+        cache.get_or_compute('a', lambda: pytest.fail('a should be cached'))
+        cache.get_or_compute('c', lambda: 3)
+
+        assert cache.get_or_compute('a', lambda: 'recomputed') == 1
+        assert cache.get_or_compute('b', lambda: 'recomputed') == 'recomputed'
+
+    def test_none_is_cached(self, clock):
+        """Test a computed None is stored rather than treated as a miss"""
+        cache = TTLCache(maxsize=4, ttl=60)
+        calls = []
+        cache.get_or_compute('k', lambda: calls.append(1))
+        cache.get_or_compute('k', lambda: calls.append(1))
+        assert len(calls) == 1
+
+    def test_compute_error_is_not_cached(self, clock):
+        """Test an exception from compute propagates and stores nothing"""
+        cache = TTLCache(maxsize=4, ttl=60)
+
+        def fail():
+            raise RuntimeError('boom')
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_compute('k', fail)
+        assert cache.get_or_compute('k', lambda: 'ok') == 'ok'
+
+    def test_clear_drops_entries(self, clock):
+        """Test clear forces the next lookup to recompute"""
+        cache = TTLCache(maxsize=4, ttl=60)
+        cache.get_or_compute('k', lambda: 'old')
+        cache.clear()
+        assert cache.get_or_compute('k', lambda: 'new') == 'new'
+
+    def test_concurrent_misses_last_writer_wins(self, clock):
+        """Test two overlapping misses both compute and the later store wins"""
+        cache = TTLCache(maxsize=4, ttl=60)
+        first_started = threading.Event()
+        release_first = threading.Event()
+
+        def slow_compute():
+            first_started.set()
+            release_first.wait(timeout=5)
+            return 'first'
+
+        worker = threading.Thread(target=cache.get_or_compute, args=('k', slow_compute))
+        worker.start()
+        assert first_started.wait(timeout=5)
+
+        # The first compute runs outside the lock, so this miss is not blocked
+        assert cache.get_or_compute('k', lambda: 'second') == 'second'
+
+        release_first.set()
+        worker.join(timeout=5)
+        assert cache.get_or_compute('k', lambda: 'third') == 'first'
+
+    def test_maxsize_bounds_entries(self, clock):
+        """Test the cache never holds more than maxsize entries"""
+        cache = TTLCache(maxsize=3, ttl=60)
+        for i in range(10):
+            cache.get_or_compute(i, lambda i=i: i)
+        assert len(cache._entries) == 3
@@ -0,0 +1,60 @@
+import decimal
+import json
+import pytest
+from flask import Flask, jsonify
+from markupsafe import Markup
+from shared.json_provider import OrjsonProvider
+
+
+@pytest.fixture
+def json_app():
+    """Bare Flask app using the orjson provider, no database needed"""
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    return app
+
+
+class TestOrjsonProvider:
+
+    def test_keys_are_sorted(self, json_app):
+        """Test output keys are sorted like Flask's default provider"""
+        assert json_app.json.dumps({'b': 1, 'a': 2}) == '{"a":2,"b":1}'
+
+    def test_non_string_keys_become_strings(self, json_app):
+        """Test int-keyed dicts (e.g. hourly averages) serialize"""
+        assert json.loads(json_app.json.dumps({9: 5.5, 14: 4.0})) == {'9': 5.5, '14': 4.0}
+
+    def test_decimal_serializes_as_string(self, json_app):
+        """Test Decimal falls back to str, matching Flask's provider"""
+        assert json_app.json.dumps({'avg': decimal.Decimal('4.25')}) == '{"avg":"4.25"}'
+
+    def test_html_objects_use_dunder_html(self, json_app):
+        """Test objects with __html__ serialize via it"""
+        assert json_app.json.dumps({'m': Markup('<b>hi</b>')}) == '{"m":"<b>hi</b>"}'
+
+    def test_unsupported_type_raises_type_error(self, json_app):
+        """Test unknown objects are rejected rather than silently dropped"""
+        with pytest.raises(TypeError):
+            json_app.json.dumps({'x': object()})
+
+    def test_loads_accepts_str_and_bytes(self, json_app):
+        """Test request bodies parse from either str or bytes"""
+        assert json_app.json.loads('{"a": [1, 2]}') == {'a': [1, 2]}
+        assert json_app.json.loads(b'{"a": null}') == {'a': None}
+
+    def test_jsonify_response(self, json_app):
+        """Test jsonify builds an application/json response through orjson"""
+        with json_app.app_context():
+            response = jsonify({'success': True, 'data': {2: 'b', 1: 'a'}})
+        assert response.mimetype == 'application/json'
+        assert response.get_data(as_text=True) == '{"data":{"1":"a","2":"b"},"success":true}'
+
+    def test_request_get_json_uses_provider(self, json_app):
+        """Test request.get_json parses through the provider"""
+        @json_app.route('/echo', methods=['POST'])
+        def echo():
+            from flask import request
+            return jsonify(request.get_json())
+
+        response = json_app.test_client().post('/echo', data='{"z": 1, "a": 2}', content_type='application/json')
+        assert response.get_data(as_text=True) == '{"a":2,"z":1}'